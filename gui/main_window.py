@@ -28,11 +28,6 @@ from gui.components.control_buttons import ControlButtons
 from gui.components.letter_section import LetterSection, StyledButton
 from gui.utils.pdf_handlers import merge_and_compress_pdfs
 
-# Configure logging
-logging.basicConfig(
-    level=logging.DEBUG,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
 logger = logging.getLogger(__name__)
 
 class MainWindow(QWidget):
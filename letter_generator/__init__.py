@@ -2,8 +2,16 @@
 from .generator import (
     generate_letter,
     generate_second_letter,
+    generate_letters,
+    generate_second_letters,
     create_word_letter,
-    convert_pdf_letter
+    create_word_letter_bytes,
+    convert_pdf_letter,
+    convert_pdf_letters_bulk,
+    convert_pdf_letters_parallel,
+    close_word_session,
+    create_pdf_letter,
+    create_pdf_letter_bytes
 )
 from .document_processor import (
     extract_names_and_address_annual,
@@ -25,8 +33,16 @@ from .exceptions import (
 __all__ = [
     'generate_letter',
     'generate_second_letter',
+    'generate_letters',
+    'generate_second_letters',
     'create_word_letter',
+    'create_word_letter_bytes',
     'convert_pdf_letter',
+    'convert_pdf_letters_bulk',
+    'convert_pdf_letters_parallel',
+    'close_word_session',
+    'create_pdf_letter',
+    'create_pdf_letter_bytes',
     'extract_names_and_address_annual',
     'extract_names_and_address_fifteen_year',
     'format_names',
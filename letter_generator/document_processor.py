@@ -1,10 +1,30 @@
 """Document content extraction and validation utilities."""
 import re
 import logging
+from functools import lru_cache
+from itertools import chain
+from typing import Iterable
 from .exceptions import ContentError, ValidationError
+from .formatter import _ADDRESS_KEYS, _NAME_SEPARATOR_RE, _join_first_names
 
 logger = logging.getLogger(__name__)
 
+# UK postcode pattern shared by both extractors
+_POSTCODE_RE = re.compile(r'[A-Z]{1,2}\d[A-Z\d]?\s*\d[A-Z]{2}', re.IGNORECASE)
+
+# Annual documents: "I/We, <names>" followed by "of <address> being ..."
+_ANNUAL_NAMES_RE = re.compile(r'I/We,\s+([^\n]+)')
+_ANNUAL_ADDRESS_RE = re.compile(r'of\s+(.*?)(?=being|$)', re.DOTALL)
+
+# 15-year documents: "(1) <names> of <address>"
+_FIFTEEN_YEAR_PARTY_RE = re.compile(r'\(1\)\s*(.*?)\s+of\s*(.*?)\s*(?=,\s*|\))', re.DOTALL)
+
+# Rule printed around raw document content in debug logs
+_DEBUG_RULE = "-" * 80
+
+# A stray 'and' inside an address line
+_AND_INFIX_RE = re.compile(r' (?:and|AND) ')
+
 def validate_content(content: str, letter_type: str) -> None:
     """Validate the content before processing."""
     if not content or not isinstance(content, str):
@@ -21,94 +41,84 @@ def validate_content(content: str, letter_type: str) -> None:
         if "ELECTRICITY ACT 1989" not in content and "Re: Electrical Equipment" not in content:
             raise ValidationError("Content does not appear to be a valid annual wayleave document")
     elif letter_type == "15-year":
-        if "This Agreement" not in content and "AGREED TERMS" not in content:
+        # AGREED TERMS is the more distinctive marker, so try it first
+        if "AGREED TERMS" not in content and "This Agreement" not in content:
             raise ValidationError("Content does not appear to be a valid 15-year wayleave document")
             
-    logger.debug(f"Content validation passed for {letter_type} document")
+    logger.debug("Content validation passed for %s document", letter_type)
 
 def clean_address_line(line: str) -> str:
     """Clean address line by removing parenthetical content, 'and', and handling whitespace."""
     if not line or line.isspace():
         return ""
         
-    # Replace newlines and multiple spaces with a single space
-    line = re.sub(r'\s+', ' ', line)
+    # Replace newlines and multiple spaces with a single space, keeping one
+    # space at either end that had whitespace so an 'and' there still matches
+    collapsed = ' '.join(line.split())
+    line = f"{' ' if line[0].isspace() else ''}{collapsed}{' ' if line[-1].isspace() else ''}"
     
     # Remove 'and' from the line
-    line = line.replace(' and ', ' ').replace(' AND ', ' ')
+    line = _AND_INFIX_RE.sub(' ', line)
     
-    if '(' in line:
-        parts = line.split()
-        if parts:
-            # Take everything before the first part containing a parenthesis
-            cleaned_parts = []
-            for part in parts:
-                if '(' in part:
-                    break
-                cleaned_parts.append(part)
-            return ' '.join(cleaned_parts) if cleaned_parts else parts[0]
+    # Keep only what comes before a parenthetical
+    head, paren, _ = line.partition('(')
+    if paren:
+        line = head
     return line.strip()
 
+@lru_cache(maxsize=4096)
 def get_first_names(full_names: str) -> str:
     """Extract and format first names from full names string."""
     if not full_names:
         return ""
     
-    # Replace various forms of 'AND' and other separators with a consistent separator
-    normalized = full_names.replace(' AND ', ',').replace('AND ', ',').replace(' & ', ',')
+    # Turn AND/and/& between people into the same comma separator in one pass
+    normalized = _NAME_SEPARATOR_RE.sub(',', full_names)
     # Split by comma and clean up each part
     names = [name.strip() for name in normalized.split(',') if name.strip()]
     
-    # Extract first names
-    first_names = []
-    for full_name in names:
-        name_parts = full_name.split()
-        if name_parts:
-            # Convert to title case for initial style
-            first_name = name_parts[0].capitalize()
-            first_names.append(first_name)
+    # Extract first names in title case; each name is non-empty once stripped
+    first_names = [full_name.split(None, 1)[0].capitalize() for full_name in names]
     
     # Format first names with title case and lowercase "and"
-    if len(first_names) == 2:
-        return f"{first_names[0]} and {first_names[1]}"
-    elif len(first_names) > 2:
-        return ", ".join(first_names[:-1]) + f" and {first_names[-1]}"
-    elif first_names:
-        return first_names[0]
-    return ""
+    return _join_first_names(first_names)
+
+def _address_dict(lines: Iterable[str], postcode: str) -> dict:
+    """Number the first 6 non-empty address lines and add the postcode."""
+    # zip stops at the sixth key, so later lines are never cleaned
+    address_dict = dict(zip(_ADDRESS_KEYS, filter(None, lines)))
+    address_dict['postcode'] = postcode
+    return address_dict
 
 def extract_names_and_address_annual(content: str) -> dict:
     """Extract names and address from annual wayleave document content."""
     try:
-        logger.debug("Raw content:")
-        logger.debug("-" * 80)
-        logger.debug(content)
-        logger.debug("-" * 80)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Raw content:\n%s\n%s\n%s", _DEBUG_RULE, content, _DEBUG_RULE)
 
         validate_content(content, "annual")
 
         logger.debug("Extracting names from annual document")
-        name_match = re.search(r'I/We,\s+([^\n]+)', content)
+        name_match = _ANNUAL_NAMES_RE.search(content)
         if not name_match:
             logger.error("Name pattern not found in content")
-            logger.debug(f"Content preview: {content[:200]}")
+            logger.debug("Content preview: %s", content[:200])
             raise ContentError("Could not find names in document")
 
         names = name_match.group(1).strip()
-        logger.debug(f"Found names: {names}")
+        logger.debug("Found names: %s", names)
 
         logger.debug("Extracting address from annual document")
-        address_match = re.search(r'of\s+(.*?)(?=being|$)', content, re.DOTALL)
+        address_match = _ANNUAL_ADDRESS_RE.search(content)
         if not address_match:
             logger.error("Address pattern not found in content")
             raise ContentError("Could not find address starting with 'of'")
 
         address = address_match.group(1).strip()
-        logger.debug(f"Found raw address: {address}")
+        logger.debug("Found raw address: %s", address)
 
         # Find postcode
-        postcode_pattern = r'[A-Z]{1,2}\d[A-Z\d]?\s*\d[A-Z]{2}'
-        postcode_match = re.search(postcode_pattern, address, flags=re.IGNORECASE)
+        postcode_match = _POSTCODE_RE.search(address)
         if not postcode_match:
             logger.error("Postcode not found in address")
             raise ContentError("Could not find valid postcode in address")
@@ -119,22 +129,8 @@ def extract_names_and_address_annual(content: str) -> dict:
         if address_parts.endswith(","):
             address_parts = address_parts[:-1]
 
-        # Split remaining address into parts and clean each line
-        parts = [clean_address_line(p) for p in address_parts.split(",")]
-        # Filter out empty lines and whitespace-only lines
-        parts = [p for p in parts if p and not p.isspace()]
-        logger.debug(f"Address parts: {parts}")
-
-        # Create address dictionary with numbered lines
-        address_dict = {}
-        current_line = 1
-        for part in parts:
-            if current_line <= 6 and part:  # Only use up to 6 address lines
-                address_dict[f'address_{current_line}'] = part
-                current_line += 1
-
-        # Add postcode
-        address_dict['postcode'] = postcode
+        address_dict = _address_dict(map(clean_address_line, address_parts.split(",")), postcode)
+        logger.debug("Address lines: %s", address_dict)
 
         # Get salutation name with title case and lowercase "and"
         salutation_name = get_first_names(names)
@@ -145,7 +141,7 @@ def extract_names_and_address_annual(content: str) -> dict:
             'address': address_dict
         }
 
-        logger.debug(f"Successfully extracted information: {result}")
+        logger.debug("Successfully extracted information: %s", result)
         return result
 
     except ContentError:
@@ -157,28 +153,25 @@ def extract_names_and_address_annual(content: str) -> dict:
 def extract_names_and_address_fifteen_year(content: str) -> dict:
     """Extract names and address from 15-year wayleave document content."""
     try:
-        logger.debug("Raw content:")
-        logger.debug("-" * 80)
-        logger.debug(content)
-        logger.debug("-" * 80)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Raw content:\n%s\n%s\n%s", _DEBUG_RULE, content, _DEBUG_RULE)
         
-        pattern = r'\(1\)\s*(.*?)\s+of\s*(.*?)\s*(?=,\s*|\))'
-        match = re.search(pattern, content, re.DOTALL)
+        match = _FIFTEEN_YEAR_PARTY_RE.search(content)
         
         if not match:
             logger.error("Name and address pattern not found in content")
-            logger.debug(f"Content preview: {content[:500]}")
+            logger.debug("Content preview: %s", content[:500])
             raise ContentError("Could not find names and address in 15-year document")
         
-        names = match.group(1).strip()
-        initial_address = clean_address_line(match.group(2).strip())
+        names, initial_address = match.groups()
+        names = names.strip()
+        initial_address = clean_address_line(initial_address.strip())
         
         # Find the complete address section
         address_text = content[match.end():].strip()
         
         # Find postcode
-        postcode_pattern = r'[A-Z]{1,2}\d[A-Z\d]?\s*\d[A-Z]{2}'
-        postcode_match = re.search(postcode_pattern, address_text, flags=re.IGNORECASE)
+        postcode_match = _POSTCODE_RE.search(address_text)
         if not postcode_match:
             logger.error("Postcode not found in address")
             raise ContentError("Could not find valid postcode in address")
@@ -189,21 +182,10 @@ def extract_names_and_address_fifteen_year(content: str) -> dict:
         if address_parts.endswith(","):
             address_parts = address_parts[:-1]
 
-        # Combine initial address with remaining parts and clean
-        all_parts = [initial_address] + [clean_address_line(p) for p in address_parts.split(",")]
-        # Filter out empty lines and whitespace-only lines
-        all_parts = [p for p in all_parts if p and not p.isspace()]
-        
-        # Create address dictionary with numbered lines
-        address_dict = {}
-        current_line = 1
-        for part in all_parts:
-            if current_line <= 6 and part:  # Only use up to 6 address lines
-                address_dict[f'address_{current_line}'] = part
-                current_line += 1
-
-        # Add postcode
-        address_dict['postcode'] = postcode
+        # The initial address comes first, then the remaining cleaned parts
+        address_dict = _address_dict(
+            chain((initial_address,), map(clean_address_line, address_parts.split(","))), postcode
+        )
 
         # Get salutation name with title case and lowercase "and"
         salutation_name = get_first_names(names)
@@ -214,7 +196,7 @@ def extract_names_and_address_fifteen_year(content: str) -> dict:
             'address': address_dict
         }
         
-        logger.debug(f"Successfully extracted information: {result}")
+        logger.debug("Successfully extracted information: %s", result)
         return result
         
     except ContentError:
@@ -1,100 +1,152 @@
 """Formatting utilities for names and addresses."""
 import re
 import logging
-from typing import Optional
+from functools import lru_cache
+from typing import List, Optional, Tuple
 from .exceptions import FormattingError
 
 logger = logging.getLogger(__name__)
 
-def format_names(full_names: str, override_salutation_name: Optional[str] = None) -> tuple:
+# Characters that are not allowed in Windows filenames
+_FILENAME_INVALID_CHARS = str.maketrans('', '', '<>:"/\\|?*')
+
+# Separators between people in a names string, shared with document_processor
+_NAME_SEPARATOR_RE = re.compile(r'\s+(?:AND|and|&)\s+')
+
+# First character of each word of a name, where words are split on spaces and hyphens
+_NAME_WORD_START_RE = re.compile(r'(?<![^-\s])[^-\s]')
+
+# Keys of the numbered address lines, in order
+_ADDRESS_KEYS = ('address_1', 'address_2', 'address_3', 'address_4', 'address_5', 'address_6')
+
+# A whole UK postcode, checked after upper-casing
+_POSTCODE_VALID_RE = re.compile(r'[A-Z]{1,2}\d[A-Z\d]?\s*\d[A-Z]{2}')
+
+@lru_cache(maxsize=4096)
+def _title_case(name: str) -> str:
+    """Convert one person's name to title case (first letter capital)."""
+    # Capitalize the first letter after each space or hyphen in one pass;
+    # str.title() would also capitalize after apostrophes and digits (O'Brien, 3Rd)
+    return _NAME_WORD_START_RE.sub(lambda m: m.group().title(), name.lower())
+
+def _join_first_names(first_names: List[str]) -> str:
+    """Join first names for a salutation as "A", "A and B" or "A, B and C"."""
+    if len(first_names) > 1:
+        *head, tail = first_names
+        return f"{', '.join(head)} and {tail}"
+    return first_names[0] if first_names else ""
+
+@lru_cache(maxsize=4096)
+def _format_names(
+    full_names: str,
+    override_salutation_name: Optional[str],
+    skip_title_case: bool
+) -> Tuple[str, str]:
+    """Build the header and salutation names; cached, as batches repeat the same names."""
+    if not full_names:
+        raise FormattingError("Names string is empty")
+    
+    # Split names and convert each to title case
+    names_list = [name for name in map(str.strip, _NAME_SEPARATOR_RE.split(full_names)) if name]
+    if not skip_title_case:
+        names_list = [_title_case(name) for name in names_list]
+    
+    if not names_list:
+        raise FormattingError("No valid names found")
+    
+    # Join with & for header
+    header_names = ' & '.join(names_list)
+    
+    # If override_salutation_name is provided, use it exactly as provided
+    if override_salutation_name is not None:
+        salutation_names = override_salutation_name  # Use exactly as provided
+    else:
+        # Get first names for salutation
+        first_names = [name.split(None, 1)[0] for name in names_list]
+        
+        # Format salutation with title case and lowercase "and"
+        salutation_names = _join_first_names(first_names)
+        
+    return header_names, salutation_names
+
+def format_names(
+    full_names: str,
+    override_salutation_name: Optional[str] = None,
+    skip_title_case: bool = False
+) -> tuple:
     """
     Format names for header and salutation.
     
     Args:
         full_names: Full names string to format
         override_salutation_name: Optional override for the salutation name (Dear {} section)
+        skip_title_case: Keep each name's casing as given, for callers whose names are already formatted
     """
     try:
-        if not full_names:
-            raise FormattingError("Names string is empty")
-        
-        # Convert names to title case (first letter capital)
-        def title_case(name):
-            # Split on spaces and hyphens to handle hyphenated names
-            parts = re.split(r'([-\s])', name.lower())
-            # Capitalize first letter of each part, keeping separators unchanged
-            return ''.join(p.capitalize() if i % 2 == 0 else p for i, p in enumerate(parts))
-        
-        # Split names and convert each to title case
-        names_list = []
-        for name in re.split(' AND | & ', full_names):
-            name = name.strip()
-            if name:
-                names_list.append(title_case(name))
-        
-        if not names_list:
-            raise FormattingError("No valid names found")
-        
-        # Join with & for header
-        header_names = ' & '.join(names_list)
-        
-        # If override_salutation_name is provided, use it exactly as provided
-        if override_salutation_name is not None:
-            salutation_names = override_salutation_name  # Use exactly as provided
-        else:
-            # Get first names for salutation
-            first_names = []
-            for name in names_list:
-                name_parts = name.split()
-                if name_parts:
-                    first_names.append(name_parts[0])
-            
-            # Format salutation with title case and lowercase "and"
-            if len(first_names) == 2:
-                salutation_names = f"{first_names[0]} and {first_names[1]}"
-            elif len(first_names) > 2:
-                salutation_names = ", ".join(first_names[:-1]) + f" and {first_names[-1]}"
-            else:
-                salutation_names = first_names[0]
-            
-        return header_names, salutation_names
+        # Unhashable arguments fail inside the cache, so they are reported here too
+        return _format_names(full_names, override_salutation_name, skip_title_case)
         
     except Exception as e:
         logger.error(f"Error formatting names: {e}")
         raise FormattingError(f"Error formatting names: {str(e)}")
 
+def _address_components(address_dict: dict) -> Tuple[Tuple[str, ...], str]:
+    """Split an address dictionary into its populated lines 1-6 and its postcode."""
+    if not isinstance(address_dict, dict):
+        raise FormattingError("Invalid address dictionary")
+    
+    lines = tuple(filter(None, map(address_dict.get, _ADDRESS_KEYS)))
+    return lines, address_dict.get('postcode') or ""
+
+@lru_cache(maxsize=4096)
+def _join_address(lines: Tuple[str, ...], postcode: str) -> str:
+    """Join address components into a block with one part per line."""
+    address_parts = []
+    
+    for line in lines:
+        # Split the line by commas and take the first part
+        line_parts = line.split(',')
+        address_parts.append(line_parts[0].strip())
+        # If there are more parts, add them as new lines
+        for part in line_parts[1:]:
+            if len(address_parts) < 6:  # Only add if we haven't reached 6 lines
+                address_parts.append(part.strip())
+    
+    # Add postcode at the end if it exists
+    postcode = postcode.strip()
+    if postcode:
+        address_parts.append(postcode)
+    
+    # Filter out empty parts and join with newlines
+    return '\n'.join(part for part in address_parts if part)
+
+def _sanitize_component(component: str) -> str:
+    """Make one address component safe to use in a filename."""
+    if not component:
+        return ""
+    # Drop invalid filename characters, then collapse whitespace runs
+    return ' '.join(component.translate(_FILENAME_INVALID_CHARS).split())
+
+def _filename_from_address(lines: Tuple[str, ...], postcode: str) -> str:
+    """Build a PDF filename from address components."""
+    # Add all address lines in order, then the postcode
+    filename_parts = [_sanitize_component(line) for line in lines]
+    if postcode:
+        filename_parts.append(_sanitize_component(postcode))
+    
+    # Filter out empty parts and join with commas
+    filename = ", ".join(part for part in filename_parts if part)
+    
+    # Ensure the filename ends with .pdf
+    if not filename.lower().endswith('.pdf'):
+        filename += '.pdf'
+        
+    return filename
+
 def format_address(address_dict: dict) -> str:
     """Format address dictionary into string with proper line breaks."""
     try:
-        if not isinstance(address_dict, dict):
-            raise FormattingError("Invalid address dictionary")
-        
-        address_parts = []
-        postcode = ""
-        
-        # Extract postcode if it exists
-        if address_dict.get('postcode'):
-            postcode = address_dict['postcode'].strip()
-        
-        # Process address lines 1-6
-        for i in range(1, 7):
-            line_key = f'address_{i}'
-            if line_key in address_dict and address_dict[line_key]:
-                # Split the line by commas and take the first part
-                line_parts = address_dict[line_key].split(',')
-                if line_parts:
-                    address_parts.append(line_parts[0].strip())
-                    # If there are more parts, add them as new lines
-                    for part in line_parts[1:]:
-                        if len(address_parts) < 6:  # Only add if we haven't reached 6 lines
-                            address_parts.append(part.strip())
-        
-        # Add postcode at the end if it exists
-        if postcode:
-            address_parts.append(postcode)
-        
-        # Filter out empty parts and join with newlines
-        return '\n'.join(part for part in address_parts if part)
+        return _join_address(*_address_components(address_dict))
         
     except Exception as e:
         logger.error(f"Error formatting address: {e}")
@@ -103,41 +155,7 @@ def format_address(address_dict: dict) -> str:
 def generate_filename(address_dict: dict) -> str:
     """Generate filename from address components."""
     try:
-        if not isinstance(address_dict, dict):
-            raise FormattingError("Invalid address dictionary")
-        
-        # Clean and sanitize each component
-        def sanitize_component(component):
-            if not component:
-                return ""
-            # Replace newlines and multiple spaces with a single space
-            component = re.sub(r'\s+', ' ', component.strip())
-            # Replace invalid filename characters
-            component = re.sub(r'[<>:"/\\|?*]', '', component)
-            return component
-        
-        filename_parts = []
-        
-        # Add all address lines in order
-        for i in range(1, 7):
-            addr_key = f'address_{i}'
-            if addr_key in address_dict and address_dict[addr_key]:
-                part = sanitize_component(address_dict[addr_key])
-                if part:
-                    filename_parts.append(part)
-            
-        # Add postcode if it exists
-        if address_dict.get('postcode'):
-            filename_parts.append(sanitize_component(address_dict['postcode']))
-        
-        # Filter out empty parts and join with commas
-        filename = ", ".join(part for part in filename_parts if part)
-        
-        # Ensure the filename ends with .pdf
-        if not filename.lower().endswith('.pdf'):
-            filename += '.pdf'
-            
-        return filename
+        return _filename_from_address(*_address_components(address_dict))
         
     except Exception as e:
         logger.error(f"Error generating filename: {e}")
@@ -145,6 +163,4 @@ def generate_filename(address_dict: dict) -> str:
 
 def validate_postcode(postcode: str) -> bool:
     """Validate UK postcode format."""
-    postcode = postcode.strip().upper()
-    postcode_pattern = r'^[A-Z]{1,2}\d[A-Z\d]?\s*\d[A-Z]{2}$'
-    return bool(re.match(postcode_pattern, postcode))
\ No newline at end of file
+    return _POSTCODE_VALID_RE.fullmatch(postcode.strip().upper()) is not None
\ No newline at end of file
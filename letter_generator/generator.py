@@ -1,29 +1,36 @@
 """Main letter generation logic."""
+import atexit
+import io
 import logging
+import multiprocessing
 import os
+import queue
+import shutil
+import tempfile
+import threading
 import time
 import subprocess
-from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Optional, Dict
-from num2words import num2words
+from typing import BinaryIO, Optional, Dict, List, Tuple, Union
 from docx import Document
 from docx.shared import Inches, Pt, Cm
 from docx.enum.text import WD_ALIGN_PARAGRAPH, WD_LINE_SPACING
 from docx.enum.section import WD_ORIENTATION
-from docx2pdf import convert
-import win32com.client
-from reportlab.lib.pagesizes import letter
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
-from reportlab.lib.styles import getSampleStyleSheet
+from docx.oxml import OxmlElement
+from docx.text.paragraph import Paragraph as DocxParagraph
 
 from constants import get_asset_path
-from .exceptions import GenerationError
+from .exceptions import ContentError, FormattingError, GenerationError
 from .templates import (
     COMPANY_FOOTER, ANNUAL_LETTER_TEMPLATE,
     FIFTEEN_YEAR_LETTER_TEMPLATE, SECOND_LETTER_TEMPLATE
 )
-from .formatter import format_names, format_address, generate_filename
+from .formatter import (
+    format_names, _address_components, _join_address, _filename_from_address
+)
 from .document_processor import (
     extract_names_and_address_annual,
     extract_names_and_address_fifteen_year,
@@ -40,118 +47,269 @@ except ImportError:
     PSUTIL_AVAILABLE = False
     logger.warning("psutil is not available. Fallback method will be used for terminating Word processes.")
 
-def create_word_letter(letter_content: str, output_path: Path, company_footer: str = COMPANY_FOOTER) -> None:
-    """Create a Word (DOCX) letter with styling and formatting."""
-    try:
-        doc = Document()
-
-        # Configure page
-        section = doc.sections[0]
-        section.page_width = Cm(21.0)
-        section.page_height = Cm(29.7)
-        section.orientation = WD_ORIENTATION.PORTRAIT
-        section.top_margin = Cm(1.54)
-        section.bottom_margin = Cm(0)
-        section.left_margin = Cm(2.54)
-        section.right_margin = Cm(2.54)
-
-        # Set style
-        style = doc.styles['Normal']
-        style.font.name = "Calibri"
-        style.font.size = Pt(11)
-        style.paragraph_format.line_spacing_rule = WD_LINE_SPACING.SINGLE
-        style.paragraph_format.space_before = Pt(0)
-        style.paragraph_format.space_after = Pt(0)
-
-        # Add logo
-        logo_path = Path(get_asset_path("asset/derland2.png"))
-        if logo_path.exists():
-            header = section.header
-            header.is_linked_to_previous = False
-            header_paragraph = header.paragraphs[0]
-            header_paragraph.alignment = WD_ALIGN_PARAGRAPH.LEFT
-            header_run = header_paragraph.add_run()
-            header_run.add_picture(str(logo_path), width=Inches(1.93), height=Inches(0.55))
+# Ordinals for the usual page counts; anything else falls back to num2words
+_ORDINALS_UPPER = (
+    "ZEROTH", "FIRST", "SECOND", "THIRD", "FOURTH", "FIFTH", "SIXTH",
+    "SEVENTH", "EIGHTH", "NINTH", "TENTH", "ELEVENTH", "TWELFTH",
+    "THIRTEENTH", "FOURTEENTH", "FIFTEENTH", "SIXTEENTH", "SEVENTEENTH",
+    "EIGHTEENTH", "NINETEENTH", "TWENTIETH", "TWENTY-FIRST", "TWENTY-SECOND",
+    "TWENTY-THIRD", "TWENTY-FOURTH", "TWENTY-FIFTH", "TWENTY-SIXTH",
+    "TWENTY-SEVENTH", "TWENTY-EIGHTH", "TWENTY-NINTH", "THIRTIETH", "THIRTY-FIRST"
+)
 
-        # Add content
-        doc.add_paragraph("")
-        doc.add_paragraph("")
-        doc.add_paragraph("")
+@lru_cache(maxsize=64)
+def _spell_ordinal_upper(number: int) -> str:
+    """Spell out an ordinal with num2words, remembering each page count seen."""
+    from num2words import num2words
+    return num2words(number, to="ordinal").upper()
+
+def _ordinal_upper(number: int) -> str:
+    """Return the upper-case ordinal word for a page number."""
+    if 0 <= number < len(_ORDINALS_UPPER):
+        return _ORDINALS_UPPER[number]
+    return _spell_ordinal_upper(number)
+
+# Extractor and first-letter template parts for each supported letter type;
+# the literal text around each template's {} slots is split once at import
+_EXTRACTORS = {
+    "annual": extract_names_and_address_annual,
+    "15-year": extract_names_and_address_fifteen_year,
+}
+_LETTER_TEMPLATE_PARTS = {
+    "annual": tuple(ANNUAL_LETTER_TEMPLATE.split("{}")),
+    "15-year": tuple(FIFTEEN_YEAR_LETTER_TEMPLATE.split("{}")),
+}
+
+def _render_first_letter(
+    parts: Tuple[str, ...],
+    current_date: str,
+    header_names: str,
+    formatted_address: str,
+    salutation_names: str,
+    sign_page: str
+) -> str:
+    """Fill a first-letter template from its pre-split parts."""
+    return "".join((
+        parts[0], current_date,
+        parts[1], header_names,
+        parts[2], formatted_address,
+        parts[3], salutation_names,
+        parts[4], sign_page,
+        parts[5]
+    ))
+
+# Literal text around the second letter's {} slots, split once at import
+_SECOND_LETTER_PARTS = tuple(SECOND_LETTER_TEMPLATE.split("{}"))
+
+def _render_second_letter(
+    current_date: str,
+    header_names: str,
+    formatted_address: str,
+    salutation_names: str
+) -> str:
+    """Fill the second letter template from its pre-split parts."""
+    parts = _SECOND_LETTER_PARTS
+    return "".join((
+        parts[0], current_date,
+        parts[1], header_names,
+        parts[2], formatted_address,
+        parts[3], salutation_names,
+        parts[4]
+    ))
+
+def _line_style(line: str) -> Optional[str]:
+    """Classify a letter line as "bold", "italic", "all" (underlined ALL) or plain (None)."""
+    # Checked in precedence order; plain substring tests beat one regex alternation here
+    if "Re:" in line or "The amount being" in line or "Please note that" in line:
+        return "bold"
+    if line.lstrip().startswith(("1)", "2)", "3)")):
+        return "italic"
+    if "which ALL" in line:
+        return "all"
+    if "DARLANDS" in line:
+        return "bold"
+    return None
+
+def _write_plain(paragraph: DocxParagraph, line: str) -> None:
+    if line:
+        paragraph.add_run(line)
+
+def _write_bold(paragraph: DocxParagraph, line: str) -> None:
+    paragraph.add_run(line).bold = True
+
+def _write_italic(paragraph: DocxParagraph, line: str) -> None:
+    paragraph.add_run(line).italic = True
+
+def _write_underlined_all(paragraph: DocxParagraph, line: str) -> None:
+    before, after = line.split("ALL", 1)
+    paragraph.add_run(before)
+    run = paragraph.add_run("ALL")
+    run.bold = True
+    run.underline = True
+    paragraph.add_run(after)
+
+# Fills a Word paragraph for each _line_style result
+_WORD_LINE_WRITERS = {
+    None: _write_plain,
+    "bold": _write_bold,
+    "italic": _write_italic,
+    "all": _write_underlined_all,
+}
+
+@lru_cache(maxsize=1)
+def _format_date(day_ordinal: int) -> str:
+    """Format a day as it appears on letters; cached for the current day."""
+    return date.fromordinal(day_ordinal).strftime("%d %B %Y")
+
+@lru_cache(maxsize=None)
+def _load_asset(relative_path: str) -> Optional[bytes]:
+    """Read an asset once per process so letters don't reopen it from disk."""
+    asset_path = Path(get_asset_path(relative_path))
+    if not asset_path.exists():
+        return None
+    return asset_path.read_bytes()
+
+@lru_cache(maxsize=None)
+def _word_template(company_footer: str) -> bytes:
+    """Build the fixed page setup, styles, header and footer once as a DOCX blob."""
+    doc = Document()
+
+    # Configure page
+    section = doc.sections[0]
+    section.page_width = Cm(21.0)
+    section.page_height = Cm(29.7)
+    section.orientation = WD_ORIENTATION.PORTRAIT
+    section.top_margin = Cm(1.54)
+    section.bottom_margin = Cm(0)
+    section.left_margin = Cm(2.54)
+    section.right_margin = Cm(2.54)
+
+    # Set style
+    style = doc.styles['Normal']
+    style.font.name = "Calibri"
+    style.font.size = Pt(11)
+    style.paragraph_format.line_spacing_rule = WD_LINE_SPACING.SINGLE
+    style.paragraph_format.space_before = Pt(0)
+    style.paragraph_format.space_after = Pt(0)
+
+    # Add logo
+    logo_bytes = _load_asset("asset/derland2.png")
+    if logo_bytes:
+        header = section.header
+        header.is_linked_to_previous = False
+        header_paragraph = header.paragraphs[0]
+        header_paragraph.alignment = WD_ALIGN_PARAGRAPH.LEFT
+        header_run = header_paragraph.add_run()
+        header_run.add_picture(io.BytesIO(logo_bytes), width=Inches(1.93), height=Inches(0.55))
+
+    # Add footer
+    section.footer_distance = Cm(0)
+    footer = section.footer
+    footer.is_linked_to_previous = False
+    footer_paragraph = footer.paragraphs[0]
+    footer_paragraph.text = ""
+    footer_paragraph.alignment = WD_ALIGN_PARAGRAPH.CENTER
+
+    # One run; python-docx turns each newline into a <w:br/>
+    run = footer_paragraph.add_run(company_footer + "\n")
+    run.font.name = "Calibri"
+    run.font.size = Pt(11)
+
+    # Blank paragraphs between the header and the letter body
+    for _ in range(4):
         doc.add_paragraph("")
 
-        lines = letter_content.splitlines()
-        sign_flg = False
-        sign_cnt = 0
-        for line in lines:
-            if "Re:" in line:
-                paragraph = doc.add_paragraph()
-                run = paragraph.add_run(line)
-                run.bold = True
-                continue
-
-            if "The amount being" in line or "Please note that" in line:
-                paragraph = doc.add_paragraph()
-                run = paragraph.add_run(line)
-                run.bold = True
-                continue
-
-            if any(x in line for x in ["1)", "2)", "3)"]):
-                paragraph = doc.add_paragraph()
-                run = paragraph.add_run(line)
-                run.italic = True
-                continue
-
-            if "which ALL" in line:
-                paragraph = doc.add_paragraph()
-                before, after = line.split("ALL", 1)
-                paragraph.add_run(before)
-                run = paragraph.add_run("ALL")
-                run.bold = True
-                run.underline = True
-                paragraph.add_run(after)
-                continue
-
-            if sign_flg:
-                sign_cnt += 1
-
-            if "Yours sincerely," in line:
-                sign_flg = True
-
-            if sign_cnt == 2:
-                signature_path = Path(get_asset_path("asset/sign.png"))
-                if signature_path.exists():
-                    sig_paragraph = doc.add_paragraph()
-                    sig_run = sig_paragraph.add_run()
-                    sig_run.add_picture(str(signature_path), width=Inches(0.9), height=Inches(0.63))
+    buffer = io.BytesIO()
+    doc.save(buffer)
+    return buffer.getvalue()
 
-            if sign_cnt < 3 or sign_cnt >= 6:
-                if "DARLANDS" in line:
-                    paragraph = doc.add_paragraph()
-                    run = paragraph.add_run(line)
-                    run.bold = True
-                else:
-                    doc.add_paragraph(line)
+def create_word_letter(
+    letter_content: str,
+    output_path: Union[Path, BinaryIO],
+    company_footer: str = COMPANY_FOOTER
+) -> None:
+    """Create a Word (DOCX) letter with styling and formatting, saved to a path or stream."""
+    try:
+        doc = Document(io.BytesIO(_word_template(company_footer)))
+        body_elements = []
 
-        # Add footer
-        section.footer_distance = Cm(0)
-        footer = section.footer
-        footer.is_linked_to_previous = False
-        footer_paragraph = footer.paragraphs[0]
-        footer_paragraph.text = ""
-        footer_paragraph.alignment = WD_ALIGN_PARAGRAPH.CENTER
+        def add_paragraph(text: str = "") -> DocxParagraph:
+            # Build detached; doc.add_paragraph rescans the body on every insert
+            element = OxmlElement('w:p')
+            body_elements.append(element)
+            paragraph = DocxParagraph(element, doc)
+            if text:
+                paragraph.add_run(text)
+            return paragraph
 
-        for line in company_footer.split('\n'):
-            run = footer_paragraph.add_run(line + "\n")
-            run.font.name = "Calibri"
-            run.font.size = Pt(11)
+        def add_line(line: str) -> None:
+            _WORD_LINE_WRITERS[_line_style(line)](add_paragraph(), line)
 
-        doc.save(str(output_path))
+        # Add content below the template's spacer paragraphs
+        lines = letter_content.splitlines()
+        closing = next((i for i, line in enumerate(lines) if "Yours sincerely," in line), None)
+        if closing is None:
+            for line in lines:
+                add_line(line)
+        else:
+            # The signature goes two lines below "Yours sincerely," and takes
+            # the place of the three blank lines that follow it
+            signature_at = closing + 2
+            for line in lines[:signature_at]:
+                add_line(line)
+            if signature_at < len(lines):
+                signature_bytes = _load_asset("asset/sign.png")
+                if signature_bytes:
+                    sig_paragraph = add_paragraph()
+                    sig_run = sig_paragraph.add_run()
+                    sig_run.add_picture(io.BytesIO(signature_bytes), width=Inches(0.9), height=Inches(0.63))
+                add_line(lines[signature_at])
+            for line in lines[signature_at + 4:]:
+                add_line(line)
+
+        # Splice the whole body in ahead of the section properties at once
+        body = doc.element.body
+        position = body.index(body.sectPr) if body.sectPr is not None else len(body)
+        body[position:position] = body_elements
+
+        if isinstance(output_path, (str, os.PathLike)):
+            output_path = os.fspath(output_path)
+        doc.save(output_path)
 
     except Exception as e:
         logger.error(f"Error creating Word DOCX: {e}")
         raise GenerationError(f"Error creating Word DOCX: {str(e)}")
 
-def terminate_word_processes():
+def create_word_letter_bytes(letter_content: str, company_footer: str = COMPANY_FOOTER) -> bytes:
+    """Create a Word (DOCX) letter in memory and return the file contents."""
+    buffer = io.BytesIO()
+    create_word_letter(letter_content, buffer, company_footer)
+    return buffer.getvalue()
+
+def _terminate_word_pid(pid: int) -> None:
+    """Forcefully terminate one Word process started by this process."""
+    if PSUTIL_AVAILABLE:
+        try:
+            proc = psutil.Process(pid)
+            # The PID may have been reused since Word exited
+            if proc.name() == 'WINWORD.EXE':
+                proc.terminate()
+                logger.info(f"Terminated Word process with PID {pid}")
+        except psutil.NoSuchProcess:
+            pass
+        except Exception as e:
+            logger.error(f"Failed to terminate Word process with PID {pid}: {e}")
+    else:
+        try:
+            subprocess.run(
+                ["taskkill", "/F", "/PID", str(pid), "/FI", "IMAGENAME eq WINWORD.EXE"],
+                check=True, capture_output=True
+            )
+            logger.info(f"Terminated Word process with PID {pid} using fallback method")
+        except subprocess.CalledProcessError as e:
+            logger.error(f"Failed to terminate Word process with PID {pid} using fallback method: {e}")
+
+def _terminate_all_word_processes() -> None:
     """Forcefully terminate all running Microsoft Word processes."""
     if PSUTIL_AVAILABLE:
         for proc in psutil.process_iter(['name']):
@@ -169,8 +327,187 @@ def terminate_word_processes():
         except subprocess.CalledProcessError as e:
             logger.error(f"Failed to terminate Word processes using fallback method: {e}")
 
-def convert_pdf_letter(letter_content: str, output_path: Path) -> None:
-    """Convert Word letter to PDF with retry logic and fallback methods."""
+def terminate_word_processes():
+    """
+    Forcefully terminate the Word processes this process started.
+    
+    Falls back to terminating every running Word process when none are
+    tracked, as with docx2pdf or when psutil is not available to find PIDs.
+    """
+    with _word_applications_lock:
+        pids = [pid for _, pid in _word_applications if pid]
+        _word_applications[:] = [entry for entry in _word_applications if not entry[1]]
+    if not pids:
+        _terminate_all_word_processes()
+        return
+    for pid in pids:
+        _terminate_word_pid(pid)
+
+# Word's ExportAsFixedFormat code for PDF (wdExportFormatPDF)
+_WD_EXPORT_FORMAT_PDF = 17
+
+# Word is a single-threaded COM server, so each thread keeps its own instance;
+# every running instance is also listed with its PID (None when unknown)
+_word_sessions = threading.local()
+_word_applications = []
+_word_applications_lock = threading.Lock()
+# Starts are serialised so each new WINWORD.EXE can be matched to its instance;
+# pool workers replace this with a lock shared across processes
+_word_start_lock = threading.Lock()
+
+@lru_cache(maxsize=1)
+def _word_com_available() -> bool:
+    """Check once whether pywin32 is installed to drive Word directly."""
+    try:
+        import pythoncom  # noqa: F401
+        import win32com.client  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+def _running_word_pids() -> set:
+    """PIDs of all running WINWORD.EXE processes, or none without psutil."""
+    if not PSUTIL_AVAILABLE:
+        return set()
+    return {proc.pid for proc in psutil.process_iter(['name']) if proc.info['name'] == 'WINWORD.EXE'}
+
+def _word_application():
+    """Return this thread's long-lived Word instance, starting it on first use."""
+    word = getattr(_word_sessions, "word", None)
+    if word is None:
+        import pythoncom
+        import win32com.client
+
+        if not getattr(_word_sessions, "com_initialized", False):
+            pythoncom.CoInitialize()
+            _word_sessions.com_initialized = True
+        with _word_start_lock:
+            # DispatchEx starts a private Word, so the user's own Word windows are untouched;
+            # Word has no API for its PID, so find the process that appeared
+            before = _running_word_pids()
+            word = win32com.client.DispatchEx("Word.Application")
+            started = _running_word_pids() - before
+        pid = started.pop() if len(started) == 1 else None
+        if pid is None and PSUTIL_AVAILABLE:
+            logger.warning("Could not identify the Word process; it will not be terminated if it hangs")
+        word.Visible = False
+        word.DisplayAlerts = 0
+        _word_sessions.word = word
+        _word_sessions.pid = pid
+        with _word_applications_lock:
+            _word_applications.append((word, pid))
+        logger.info("Started Word for PDF conversion")
+    return word
+
+def _discard_word_application() -> None:
+    """
+    Quit this thread's Word instance after a failure so the next call starts a fresh one.
+    
+    A Word that does not quit is terminated by PID; when its PID is unknown it
+    is left running, as killing every WINWORD.EXE would also take down other
+    workers' Word and the user's own documents.
+    """
+    word = getattr(_word_sessions, "word", None)
+    pid = getattr(_word_sessions, "pid", None)
+    _word_sessions.word = _word_sessions.pid = None
+    if word is None:
+        return
+    with _word_applications_lock:
+        _word_applications[:] = [entry for entry in _word_applications if entry[0] is not word]
+    try:
+        word.Quit()
+    except Exception as e:
+        logger.warning(f"Word did not quit cleanly: {e}")
+        if pid:
+            _terminate_word_pid(pid)
+        else:
+            logger.error("Abandoning a Word instance whose process could not be identified")
+
+def close_word_session() -> None:
+    """
+    Quit this thread's Word instance and release COM for the thread.
+    
+    Call it from a thread that converted letters before the thread ends; Word
+    objects can only be closed from the thread that started them.
+    """
+    _discard_word_application()
+    if getattr(_word_sessions, "com_initialized", False):
+        import pythoncom
+        pythoncom.CoUninitialize()
+        _word_sessions.com_initialized = False
+
+@atexit.register
+def _quit_word_applications() -> None:
+    """Close the Word instances left running when the process exits."""
+    # Instances owned by this thread quit normally; ones started on other
+    # threads usually refuse the call, so their processes are terminated
+    close_word_session()
+    with _word_applications_lock:
+        applications = list(_word_applications)
+        _word_applications.clear()
+    for word, pid in applications:
+        try:
+            word.Quit()
+        except Exception as e:
+            logger.warning(f"Word did not quit cleanly: {e}")
+            if pid:
+                _terminate_word_pid(pid)
+
+def _export_pdf_with_word(docx_path: Union[str, Path], output_path: Union[str, Path]) -> None:
+    """Convert one DOCX to PDF with this thread's persistent Word instance."""
+    document = _word_application().Documents.Open(os.path.abspath(docx_path), ReadOnly=True)
+    try:
+        document.ExportAsFixedFormat(os.path.abspath(output_path), _WD_EXPORT_FORMAT_PDF)
+    finally:
+        document.Close(0)
+
+# LibreOffice start-up allowance, plus a per-file allowance, in seconds
+_SOFFICE_STARTUP_TIMEOUT = 60
+_SOFFICE_FILE_TIMEOUT = 10
+
+# PDF engines accepted by convert_pdf_letter and the PDF_BACKEND environment variable
+_PDF_ENGINES = ("docx2pdf", "soffice", "reportlab")
+
+def _pdf_backend() -> str:
+    """Conversion backend selected with the PDF_BACKEND environment variable."""
+    backend = os.environ.get("PDF_BACKEND") or "docx2pdf"
+    if backend not in _PDF_ENGINES:
+        raise GenerationError(f"Unknown PDF_BACKEND: {backend}")
+    return backend
+
+def _convert_with_soffice(docx_paths: List[Path], out_dir: Path) -> None:
+    """Convert DOCX files to same-named PDFs in out_dir with a single LibreOffice run."""
+    soffice = shutil.which("soffice") or shutil.which("libreoffice")
+    if not soffice:
+        raise GenerationError("LibreOffice (soffice) was not found on PATH")
+    subprocess.run(
+        [soffice, "--headless", "--convert-to", "pdf", "--outdir", os.fspath(out_dir),
+         *map(os.fspath, docx_paths)],
+        check=True,
+        capture_output=True,
+        timeout=_SOFFICE_STARTUP_TIMEOUT + _SOFFICE_FILE_TIMEOUT * len(docx_paths),
+    )
+
+def convert_pdf_letter(letter_content: str, output_path: Path, *, engine: Optional[str] = None) -> None:
+    """
+    Convert Word letter to PDF with retry logic and fallback methods.
+    
+    Args:
+        letter_content: Rendered letter text
+        output_path: Where to save the PDF; the DOCX is written beside it
+        engine: "docx2pdf" to convert through Word (a persistent Word instance
+            when pywin32 is available, docx2pdf otherwise), "soffice" to convert
+            with LibreOffice, or "reportlab" to build the PDF directly without a
+            DOCX or an Office process; defaults to the PDF_BACKEND environment
+            variable, then "docx2pdf"
+    """
+    engine = engine or _pdf_backend()
+    if engine not in _PDF_ENGINES:
+        raise GenerationError(f"Unknown PDF engine: {engine}")
+    if engine == "reportlab":
+        create_pdf_letter(letter_content, output_path)
+        return
+
     try:
         # Create Word document with same name as final PDF
         docx_path = output_path.with_suffix('.docx')
@@ -185,26 +522,48 @@ def convert_pdf_letter(letter_content: str, output_path: Path) -> None:
         if not output_dir.exists():
             logger.error(f"Output directory does not exist: {output_dir}")
             raise GenerationError(f"Output directory does not exist: {output_dir}")
-        if not os.access(str(output_dir), os.W_OK):
+        if not os.access(output_dir, os.W_OK):
             logger.error(f"No write permission for output directory: {output_dir}")
             raise GenerationError(f"No write permission for output directory: {output_dir}")
         
+        if engine == "soffice":
+            # Convert into a fresh folder so a PDF left from an earlier run can't
+            # pass for this one; LibreOffice names the PDF after the DOCX
+            with tempfile.TemporaryDirectory() as pdf_dir:
+                _convert_with_soffice([docx_path], Path(pdf_dir))
+                pdf_file = Path(pdf_dir) / output_path.name
+                # soffice can exit 0 without converting, e.g. when its profile is locked
+                if not pdf_file.exists():
+                    logger.error(f"PDF file was not created: {output_path}")
+                    raise GenerationError(f"LibreOffice did not create the PDF: {output_path}")
+                shutil.move(pdf_file, output_path)
+            logger.info(f"PDF conversion successful: {output_path}")
+            return
+
+        if _word_com_available():
+            convert = _export_pdf_with_word
+        else:
+            from docx2pdf import convert
+
         # Attempt PDF conversion with retry logic
+        docx_file, pdf_file = os.fspath(docx_path), os.fspath(output_path)
         max_retries = 3
         for attempt in range(max_retries):
             try:
                 logger.info(f"Attempting to convert {docx_path} to {output_path} (Attempt {attempt + 1})")
-                convert(str(docx_path), str(output_path))
+                convert(docx_file, pdf_file)
                 logger.info(f"PDF conversion successful: {output_path}")
                 return
             except Exception as e:
                 logger.warning(f"PDF conversion attempt {attempt + 1} failed: {str(e)}")
-                terminate_word_processes()
+                # Only this thread's Word is restarted when Word is driven directly
+                if _word_com_available():
+                    _discard_word_application()
+                else:
+                    terminate_word_processes()
                 time.sleep(2)  # Wait before retrying
         
-        # If all attempts fail, try fallback method
-        logger.error("All conversion attempts failed. Trying fallback method.")
-        # fallback_convert_pdf(docx_path, output_path)
+        logger.error(f"All {max_retries} conversion attempts failed")
         
         # Check if the PDF was actually created
         if not output_path.exists():
@@ -215,16 +574,314 @@ def convert_pdf_letter(letter_content: str, output_path: Path) -> None:
         logger.error(f"Error creating PDF: {str(e)}", exc_info=True)
         raise GenerationError(f"Error creating PDF: {str(e)}")
 
+def _export_pdfs_pipelined(jobs: List[Tuple[str, Path]], docx_dir: Path, pdf_dir: Path) -> None:
+    """Export letters with Word while a background thread writes the next DOCX files."""
+    # Word stays on this thread (COM objects belong to the thread that made them);
+    # the small queue keeps the writer at most two letters ahead
+    ready = queue.Queue(maxsize=2)
+    stop = threading.Event()
+    errors = []
+
+    def write_letters() -> None:
+        try:
+            for index, (letter_content, _) in enumerate(jobs):
+                if stop.is_set():
+                    break
+                create_word_letter(letter_content, docx_dir / f"letter_{index}.docx")
+                ready.put(index)
+        except Exception as e:
+            errors.append(e)
+        finally:
+            ready.put(None)
+
+    writer = threading.Thread(target=write_letters, name="docx-writer", daemon=True)
+    writer.start()
+    finished = False
+    try:
+        for index in iter(ready.get, None):
+            _export_pdf_with_word(docx_dir / f"letter_{index}.docx", pdf_dir / f"letter_{index}.pdf")
+        finished = True
+    finally:
+        if not finished:
+            # Unblock the writer so it stops before the temp directory goes away
+            stop.set()
+            for _ in iter(ready.get, None):
+                pass
+        writer.join()
+
+    if errors:
+        raise errors[0]
+
+def convert_pdf_letters_bulk(jobs: List[Tuple[str, Path]]) -> List[Path]:
+    """
+    Convert many letters to PDF in a single Word or LibreOffice session.
+    
+    Set PDF_BACKEND=soffice to convert with one LibreOffice run instead of Word,
+    or PDF_BACKEND=reportlab to build every PDF directly.
+    
+    Args:
+        jobs: (letter_content, output_path) for each letter
+    
+    Returns:
+        Paths of the generated PDFs, in the same order as jobs
+    """
+    if not jobs:
+        return []
+
+    try:
+        backend = _pdf_backend()
+        if backend == "reportlab":
+            for letter_content, output_path in jobs:
+                create_pdf_letter(letter_content, output_path)
+            return [output_path for _, output_path in jobs]
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            docx_dir = Path(temp_dir) / "docx"
+            pdf_dir = Path(temp_dir) / "pdf"
+            docx_dir.mkdir()
+            pdf_dir.mkdir()
+
+            soffice = backend == "soffice"
+            pipelined = not soffice and _word_com_available()
+            if not pipelined:
+                for index, (letter_content, _) in enumerate(jobs):
+                    create_word_letter(letter_content, docx_dir / f"letter_{index}.docx")
+
+            try:
+                logger.info(f"Converting {len(jobs)} letters to PDF")
+                if soffice:
+                    # One LibreOffice start-up is shared by every letter
+                    _convert_with_soffice(sorted(docx_dir.glob("*.docx")), pdf_dir)
+                elif pipelined:
+                    # The persistent Word instance is reused for every letter
+                    _export_pdfs_pipelined(jobs, docx_dir, pdf_dir)
+                else:
+                    # Converting the folder starts Word once for every letter in it
+                    from docx2pdf import convert
+                    convert(os.fspath(docx_dir), os.fspath(pdf_dir))
+            except GenerationError:
+                # A letter could not be written; converting one by one would fail the same way
+                raise
+            except Exception as e:
+                logger.warning(f"Bulk PDF conversion failed: {str(e)}")
+                if pipelined:
+                    _discard_word_application()
+                elif not soffice:
+                    terminate_word_processes()
+
+            for index, (letter_content, output_path) in enumerate(jobs):
+                pdf_file = pdf_dir / f"letter_{index}.pdf"
+                if pdf_file.exists():
+                    shutil.move(docx_dir / f"letter_{index}.docx", output_path.with_suffix('.docx'))
+                    shutil.move(pdf_file, output_path)
+                else:
+                    # Fall back to one-at-a-time conversion with retries
+                    convert_pdf_letter(letter_content, output_path)
+
+        logger.info(f"Bulk PDF conversion finished for {len(jobs)} letters")
+        return [output_path for _, output_path in jobs]
+
+    except GenerationError:
+        raise
+    except Exception as e:
+        logger.error(f"Error creating PDFs: {str(e)}", exc_info=True)
+        raise GenerationError(f"Error creating PDFs: {str(e)}")
+
+def _init_word_worker(start_lock) -> None:
+    """Share the Word start-up lock and close the worker's Word session at shutdown."""
+    global _word_start_lock
+    from multiprocessing.util import Finalize
+    # Workers start Word one at a time so each can tell which WINWORD.EXE is its own
+    _word_start_lock = start_lock
+    # Pool workers convert on their main thread, which also runs the finalizers
+    Finalize(None, close_word_session, exitpriority=10)
+
+def _convert_pdf_letter_job(job: Tuple[str, Path]) -> Path:
+    """Convert one letter to PDF (runs in a worker process with its own Word)."""
+    letter_content, output_path = job
+    convert_pdf_letter(letter_content, output_path, engine="docx2pdf")
+    return output_path
+
+def convert_pdf_letters_parallel(jobs: List[Tuple[str, Path]], max_workers: Optional[int] = None) -> List[Path]:
+    """
+    Convert many letters to PDF through Word in parallel worker processes.
+    
+    Worker processes are only used for Word; other PDF_BACKEND values, or
+    Word through docx2pdf, run as a single convert_pdf_letters_bulk session.
+    
+    Args:
+        jobs: (letter_content, output_path) for each letter
+        max_workers: Number of worker processes, each running its own Word;
+            defaults to the CPU count, capped at 4
+    
+    Returns:
+        Paths of the generated PDFs, in the same order as jobs
+    """
+    if not jobs:
+        return []
+    if _pdf_backend() != "docx2pdf" or not _word_com_available():
+        # Concurrent soffice runs on one user profile fail each other, and
+        # docx2pdf shares one Word and quits it after every call, so workers
+        # would close it under each other; one session is the safe option
+        return convert_pdf_letters_bulk(jobs)
+
+    workers = max_workers or min(os.cpu_count() or 1, 4)
+    start_lock = multiprocessing.Lock()
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_word_worker, initargs=(start_lock,)
+    ) as executor:
+        return list(executor.map(_convert_pdf_letter_job, jobs))
+
+@lru_cache(maxsize=None)
+def _pdf_stylesheet():
+    """Build ReportLab's sample stylesheet once instead of per PDF."""
+    from reportlab.lib.styles import getSampleStyleSheet
+    return getSampleStyleSheet()
+
+def _pdf_markup(line: str) -> str:
+    """Apply the Word letter's line formatting rules as ReportLab paragraph markup."""
+    from xml.sax.saxutils import escape
+
+    style = _line_style(line)
+    if style == "bold":
+        return f"<b>{escape(line)}</b>"
+    if style == "italic":
+        return f"<i>{escape(line)}</i>"
+    if style == "all":
+        before, after = line.split("ALL", 1)
+        return f"{escape(before)}<b><u>ALL</u></b>{escape(after)}"
+    return escape(line)
+
+@lru_cache(maxsize=None)
+def _pdf_letter_styles():
+    """Derive the letter body and footer styles once, leaving the shared Normal style untouched."""
+    from reportlab.lib.styles import ParagraphStyle
+
+    body_style = ParagraphStyle(
+        "LetterBody", parent=_pdf_stylesheet()["Normal"], fontName="Helvetica", fontSize=11, leading=13.4
+    )
+    footer_style = ParagraphStyle("LetterFooter", parent=body_style, alignment=1)
+    return body_style, footer_style
+
+def _pdf_footer_paragraph(company_footer: str):
+    """Build the centred PDF footer, wrapped to the page's text width, and its height."""
+    from reportlab.lib.pagesizes import A4
+    from reportlab.lib.units import cm
+    from reportlab.platypus import Paragraph
+    from xml.sax.saxutils import escape
+
+    _, footer_style = _pdf_letter_styles()
+    footer = Paragraph("<br/>".join(escape(line) for line in company_footer.split('\n')), footer_style)
+    page_width, page_height = A4
+    _, height = footer.wrap(page_width - 2 * 2.54 * cm, page_height)
+    return footer, height
+
+def create_pdf_letter(
+    letter_content: str,
+    output_path: Union[Path, BinaryIO],
+    company_footer: str = COMPANY_FOOTER
+) -> None:
+    """
+    Create a PDF letter directly with ReportLab, without a DOCX or Word round-trip.
+    
+    Args:
+        letter_content: Rendered letter text
+        output_path: Where to save the PDF, as a path or a writable binary stream
+        company_footer: Footer text drawn at the bottom of every page
+    """
+    try:
+        from reportlab.lib.pagesizes import A4
+        from reportlab.lib.units import cm, inch
+        from reportlab.lib.utils import ImageReader
+        from reportlab.platypus import Image, Paragraph, SimpleDocTemplate, Spacer
+
+        body_style, _ = _pdf_letter_styles()
+        # Flowables hold the canvas while drawing, so each letter gets its own footer
+        footer, footer_height = _pdf_footer_paragraph(company_footer)
+        page_width, page_height = A4
+
+        logo_bytes = _load_asset("asset/derland2.png")
+        logo = ImageReader(io.BytesIO(logo_bytes)) if logo_bytes else None
+
+        def draw_page(canvas, doc):
+            canvas.saveState()
+            if logo is not None:
+                canvas.drawImage(
+                    logo, 2.54 * cm, page_height - 1.25 * cm - 0.55 * inch,
+                    width=1.93 * inch, height=0.55 * inch, mask='auto'
+                )
+            footer.drawOn(canvas, 2.54 * cm, 0.2 * cm)
+            canvas.restoreState()
+
+        flowables = []
+
+        def add_line(line: str) -> None:
+            if line.strip():
+                flowables.append(Paragraph(_pdf_markup(line), body_style))
+            else:
+                # Empty paragraphs have no height in ReportLab
+                flowables.append(Spacer(1, body_style.leading))
+
+        # Add content
+        for _ in range(4):
+            add_line("")
+
+        lines = letter_content.splitlines()
+        closing = next((i for i, line in enumerate(lines) if "Yours sincerely," in line), None)
+        if closing is None:
+            for line in lines:
+                add_line(line)
+        else:
+            # Same signature placement as create_word_letter
+            signature_at = closing + 2
+            for line in lines[:signature_at]:
+                add_line(line)
+            if signature_at < len(lines):
+                signature_bytes = _load_asset("asset/sign.png")
+                if signature_bytes:
+                    flowables.append(
+                        Image(io.BytesIO(signature_bytes), width=0.9 * inch, height=0.63 * inch, hAlign='LEFT')
+                    )
+                add_line(lines[signature_at])
+            for line in lines[signature_at + 4:]:
+                add_line(line)
+
+        if isinstance(output_path, (str, os.PathLike)):
+            output_path = os.fspath(output_path)
+        pdf = SimpleDocTemplate(
+            output_path,
+            pagesize=A4,
+            topMargin=1.54 * cm + 0.55 * inch,
+            bottomMargin=footer_height + 0.4 * cm,
+            leftMargin=2.54 * cm,
+            rightMargin=2.54 * cm,
+        )
+        pdf.build(flowables, onFirstPage=draw_page, onLaterPages=draw_page)
+        logger.info(f"PDF created successfully: {output_path}")
+
+    except Exception as e:
+        logger.error(f"Error creating PDF: {str(e)}")
+        raise GenerationError(f"Error creating PDF: {str(e)}")
+
+def create_pdf_letter_bytes(letter_content: str, company_footer: str = COMPANY_FOOTER) -> bytes:
+    """Create a PDF letter in memory with ReportLab and return the file contents."""
+    buffer = io.BytesIO()
+    create_pdf_letter(letter_content, buffer, company_footer)
+    return buffer.getvalue()
+
 def fallback_convert_pdf(docx_path: Path, output_path: Path) -> None:
     """Fallback method to convert DOCX to PDF using ReportLab."""
     try:
+        from reportlab.lib.pagesizes import letter
+        from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
+
         # Read the content from the DOCX file
         doc = Document(docx_path)
         content = "\n".join([paragraph.text for paragraph in doc.paragraphs])
 
         # Create a PDF using ReportLab
         pdf = SimpleDocTemplate(str(output_path), pagesize=letter)
-        styles = getSampleStyleSheet()
+        styles = _pdf_stylesheet()
         flowables = []
 
         for line in content.split('\n'):
@@ -258,18 +915,16 @@ def generate_letter(
         override_salutation_name: Optional salutation name to use in the Dear {} section
     """
     try:
-        logger.info(f"Generating {letter_type} letter")
+        logger.info("Generating %s letter", letter_type)
         
-        if letter_type not in ["annual", "15-year"]:
+        try:
+            extract = _EXTRACTORS[letter_type]
+        except KeyError:
             raise GenerationError(f"Invalid letter type: {letter_type}")
         
         # Extract information
-        if letter_type == "annual":
-            info = extract_names_and_address_annual(content)
-            template = ANNUAL_LETTER_TEMPLATE
-        else:
-            info = extract_names_and_address_fifteen_year(content)
-            template = FIFTEEN_YEAR_LETTER_TEMPLATE
+        info = extract(content)
+        template_parts = _LETTER_TEMPLATE_PARTS[letter_type]
         
         # Use override values if provided
         names_to_use = override_names if override_names is not None else info['full_names']
@@ -277,23 +932,26 @@ def generate_letter(
         
         # Format details
         header_names, _ = format_names(names_to_use)  # Get header names only
-        formatted_address = format_address(address_to_use)
-        current_date = datetime.now().strftime("%d %B %Y")
+        address_lines, postcode = _address_components(address_to_use)
+        formatted_address = _join_address(address_lines, postcode)
+        current_date = _format_date(date.today().toordinal())
         page_counts = (page_count - 1) if letter_type == "annual" else page_count
-        sign_page = num2words(page_counts, to="ordinal").upper()
+        sign_page = _ordinal_upper(page_counts)
 
         # Use override_salutation_name directly if provided, otherwise use formatted salutation
         salutation_names = override_salutation_name if override_salutation_name is not None else info['salutation_name']
 
         # Generate letter
-        letter = template.format(
+        letter = _render_first_letter(
+            template_parts,
             current_date,
-            f"{header_names}\n{formatted_address}",
+            header_names,
+            formatted_address,
             salutation_names,  # Use salutation name directly
             sign_page
         )
         
-        filename = generate_filename(address_to_use)
+        filename = _filename_from_address(address_lines, postcode)
         
         logger.info("Letter generation successful")
         return letter, filename
@@ -302,34 +960,23 @@ def generate_letter(
         logger.error(f"Error generating {letter_type} letter: {e}")
         raise GenerationError(f"Error generating letter: {str(e)}")
 
-def generate_second_letter(
+def _second_letter(
     content: str,
-    letter_type: str = "annual",
+    letter_type: str,
+    current_date: str,
     override_names: Optional[str] = None,
     override_address: Optional[Dict] = None,
     override_salutation_name: Optional[str] = None
-) -> tuple:
-    """
-    Generate a second wayleave letter based on document content.
-    
-    Args:
-        content: The document content to process
-        letter_type: Type of letter ('annual' or '15-year')
-        override_names: Optional names to use instead of extracted ones
-        override_address: Optional address dict to use instead of extracted one
-        override_salutation_name: Optional salutation name to use in the Dear {} section
-    """
+) -> Tuple[str, str]:
+    """Generate one second letter and its filename for an already formatted date."""
     try:
-        logger.info(f"Generating second {letter_type} letter")
-        
-        if letter_type not in ["annual", "15-year"]:
+        try:
+            extract = _EXTRACTORS[letter_type]
+        except KeyError:
             raise GenerationError(f"Invalid letter type: {letter_type}")
         
         # Extract information
-        if letter_type == "annual":
-            info = extract_names_and_address_annual(content)
-        else:
-            info = extract_names_and_address_fifteen_year(content)
+        info = extract(content)
         
         # Use override values if provided
         names_to_use = override_names if override_names is not None else info['full_names']
@@ -337,24 +984,138 @@ def generate_second_letter(
         
         # Format details
         header_names, _ = format_names(names_to_use)  # Get header names only
-        formatted_address = format_address(address_to_use)
-        current_date = datetime.now().strftime("%d %B %Y")
+        address_lines, postcode = _address_components(address_to_use)
+        formatted_address = _join_address(address_lines, postcode)
 
         # Use override_salutation_name directly if provided, otherwise use formatted salutation
         salutation_names = override_salutation_name if override_salutation_name is not None else info['salutation_name']
 
         # Generate letter
-        letter = SECOND_LETTER_TEMPLATE.format(
+        letter = _render_second_letter(
             current_date,
-            f"{header_names}\n{formatted_address}",
-            salutation_names,  # Use salutation name directly
+            header_names,
+            formatted_address,
+            salutation_names  # Use salutation name directly
         )
         
-        filename = generate_filename(address_to_use)
-        
-        logger.info("Second letter generation successful")
-        return letter, filename
+        return letter, _filename_from_address(address_lines, postcode)
         
-    except Exception as e:
+    except (ContentError, FormattingError, GenerationError, KeyError, ValueError, AttributeError, TypeError) as e:
         logger.error(f"Error generating second {letter_type} letter: {e}")
-        raise GenerationError(f"Error generating second letter: {str(e)}")
\ No newline at end of file
+        raise GenerationError(f"Error generating second letter: {str(e)}")
+
+def generate_second_letter(
+    content: str,
+    letter_type: str = "annual",
+    override_names: Optional[str] = None,
+    override_address: Optional[Dict] = None,
+    override_salutation_name: Optional[str] = None
+) -> tuple:
+    """
+    Generate a second wayleave letter based on document content.
+    
+    Args:
+        content: The document content to process
+        letter_type: Type of letter ('annual' or '15-year')
+        override_names: Optional names to use instead of extracted ones
+        override_address: Optional address dict to use instead of extracted one
+        override_salutation_name: Optional salutation name to use in the Dear {} section
+    """
+    logger.info("Generating second %s letter", letter_type)
+    letter, filename = _second_letter(
+        content,
+        letter_type,
+        _format_date(date.today().toordinal()),
+        override_names,
+        override_address,
+        override_salutation_name
+    )
+    logger.info("Second letter generation successful")
+    return letter, filename
+
+def generate_second_letters(jobs: List[Tuple[str, str]]) -> List[Tuple[str, str]]:
+    """
+    Generate second letters for many documents in one call.
+    
+    Args:
+        jobs: (content, letter_type) for each document
+    
+    Returns:
+        (letter, filename) for each job, in the same order
+    """
+    # The date is formatted once for the whole batch
+    current_date = _format_date(date.today().toordinal())
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
+
+    results = []
+    for content, letter_type in jobs:
+        results.append(_second_letter(content, letter_type, current_date))
+        if debug_enabled:
+            logger.debug("Generated second %s letter", letter_type)
+
+    logger.info("Generated %d second letters", len(results))
+    return results
+
+def _render_letter_job(record: Tuple[str, str, int]) -> Tuple[str, str]:
+    """Render one letter and its filename (runs in a worker process)."""
+    content, letter_type, page_count = record
+    return generate_letter(content, letter_type, page_count)
+
+def _write_letter_job(job: Tuple[str, Path], output_format: str) -> Path:
+    """Save one rendered letter as DOCX or PDF (runs in a worker process)."""
+    letter, output_path = job
+    if output_format == "pdf":
+        # ReportLab objects don't pickle, so the PDF is built entirely in the worker
+        create_pdf_letter(letter, output_path)
+    else:
+        create_word_letter(letter, output_path)
+    return output_path
+
+def _unique_output_paths(filenames: List[str], output_dir: Path, output_format: str) -> List[Path]:
+    """Name each letter after its address, numbering repeats as "<address> (2)" and so on."""
+    used = set()
+    paths = []
+    for filename in filenames:
+        stem = Path(filename).stem
+        name, count = stem, 1
+        # Windows filenames are case-insensitive
+        while name.lower() in used:
+            count += 1
+            name = f"{stem} ({count})"
+        used.add(name.lower())
+        paths.append(output_dir / f"{name}.{output_format}")
+    return paths
+
+def generate_letters(
+    records: List[Tuple[str, str, int]],
+    output_dir: Path,
+    max_workers: Optional[int] = None,
+    output_format: str = "docx"
+) -> List[Path]:
+    """
+    Generate letters for many documents in parallel worker processes.
+    
+    Args:
+        records: (content, letter_type, page_count) for each document
+        output_dir: Folder the letters are written to
+        max_workers: Number of worker processes, defaults to the CPU count
+        output_format: "docx" for Word letters, or "pdf" to build PDFs directly with ReportLab
+    
+    Returns:
+        Paths of the generated letters, in the same order as records; letters
+        for the same address are numbered "<address> (2)" and so on
+    """
+    if output_format not in ("docx", "pdf"):
+        raise GenerationError(f"Unsupported output format: {output_format}")
+    if not records:
+        return []
+
+    workers = max_workers or os.cpu_count() or 1
+    chunksize = max(1, len(records) // (4 * workers))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        # Letters are rendered first so records sharing an address get distinct files
+        rendered = list(executor.map(_render_letter_job, records, chunksize=chunksize))
+        output_paths = _unique_output_paths([filename for _, filename in rendered], output_dir, output_format)
+        write = partial(_write_letter_job, output_format=output_format)
+        jobs = [(letter, path) for (letter, _), path in zip(rendered, output_paths)]
+        return list(executor.map(write, jobs, chunksize=chunksize))
@@ -6,6 +6,7 @@ E: info@darlands.co.uk     W: darlands.co.uk     Company No. 12185075"""
 ANNUAL_LETTER_TEMPLATE = """{}
 
 {}
+{}
 
 
 Dear {}
@@ -40,6 +41,7 @@ DARLANDS"""
 FIFTEEN_YEAR_LETTER_TEMPLATE = """{}
 
 {}
+{}
 
 
 Dear {}
@@ -74,6 +76,7 @@ DARLANDS"""
 SECOND_LETTER_TEMPLATE = """{}
 
 {}
+{}
 
 
 Dear {}
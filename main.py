@@ -7,7 +7,7 @@ from gui.main_window import MainWindow  # Updated import to use new implementati
 
 # Configure logging
 logging.basicConfig(
-    level=logging.DEBUG,  # Set to DEBUG for more detailed output
+    level=logging.INFO,  # Set to DEBUG to log raw document content
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
 logger = logging.getLogger(__name__)
@@ -10,11 +10,6 @@ import argparse
 from constants import PDF_EXTENSION, REQUIRED_PDF_COUNT, PROCESSED_FOLDER_MARKER
 from document_classifier import identify_wayleave_type
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
 logger = logging.getLogger(__name__)
 
 class PDFType: